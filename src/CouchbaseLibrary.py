@@ -1,13 +1,55 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Optional, Union
+import logging
+from collections import OrderedDict, namedtuple
+from copy import deepcopy
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+from urllib.parse import urlencode
 
 from couchbase.bucket import Bucket
-from couchbase.exceptions import CouchbaseError
+from couchbase.exceptions import CouchbaseError, NotFoundError
+from couchbase.result import ValueResult
+from couchbase.user_constants import OBS_FOUND, OBS_PERSISTED
 from robot.api import logger
-from robot.utils import ConnectionCache
+from robot.utils import ConnectionCache, is_truthy
 
-from JsonValidator import JsonValidator, JsonValidatorError
+_IPV6_MODES = frozenset(('disabled', 'allow', 'only'))
+_OBSERVE_FOUND_FLAGS = frozenset((OBS_FOUND, OBS_PERSISTED))
+_BULK_OPTIONS = {'operation_timeout': '10'}
+
+# Snapshot of a get result kept in the result cache.
+_CachedResult = namedtuple('_CachedResult', ('value', 'cas', 'rc', 'success'))
+
+
+def _debug_enabled() -> bool:
+    """
+    Check if debug messages are written to the log.
+    Robot Framework keeps the level of the root logger in sync with the current log level.
+    """
+    return logging.getLogger().isEnabledFor(logging.DEBUG)
+
+
+def _option_value(value: Any) -> str:
+    """
+    Convert a value of the Couchbase client option to its connection string form.
+    Booleans are written as "true" and "false".
+    """
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _chunks(items: List, chunk_size: Union[int, str, None]) -> Iterator[List]:
+    """
+    Split items into lists of at most chunk_size elements.
+    If chunk_size is not set, all items are returned as one list.
+    """
+    chunk_size = int(chunk_size) if chunk_size else 0
+    if chunk_size <= 0:
+        yield items
+        return
+    for start in range(0, len(items), chunk_size):
+        yield items[start:start + chunk_size]
 
 
 class CouchbaseLibrary(object):
@@ -25,16 +67,41 @@ class CouchbaseLibrary(object):
 
     ROBOT_LIBRARY_SCOPE = 'GLOBAL'
 
-    def __init__(self) -> None:
-        """ Initialization. """
+    __slots__ = ('_bucket', '_cache', '_bucket_pool', '_pending', '_cache_results', '_cache_size', '_result_cache',
+                 '_json_validator', '_json_validator_error')
+
+    def __init__(self, cache_results: Union[bool, str] = False, cache_size: Union[int, str] = 1000) -> None:
+        """
+        Initialization.
+
+        *Args:*\n
+            _cache_results_ - remember read documents and serve repeated reads of the same keys from memory,
+            see [#Clear Couchbase Cache | Clear Couchbase Cache];\n
+            _cache_size_ - maximum number of remembered documents;\n
+
+        *Example:*\n
+        | Library | CouchbaseLibrary | cache_results=True |
+        """
         self._bucket: Optional[Bucket] = None
         self._cache = ConnectionCache()
+        self._bucket_pool: Dict[Tuple[str, str, str, Optional[str], str, Tuple[Tuple[str, str], ...]], Bucket] = {}
+        self._pending: Optional[Dict[str, Tuple[str, Any]]] = None
+        self._cache_results = is_truthy(cache_results)
+        self._cache_size = int(cache_size)
+        if self._cache_size < 0:
+            raise Exception(f'Invalid cache_size value "{cache_size}". It must not be negative.')
+        self._result_cache: 'OrderedDict[Tuple[int, str], _CachedResult]' = OrderedDict()
+        self._json_validator = None
+        self._json_validator_error: Optional[Type[Exception]] = None
 
     def connect_to_couchbase_bucket(self, host: str, port: Union[str, int], bucket_name: str, password: str = None,
-                                    alias: str = None, ipv6: str = "disabled") -> int:
+                                    alias: str = None, ipv6: str = "disabled", options: Dict[str, Any] = None) -> int:
         """
         Connect to a Couchbase bucket.
 
+        Connections are pooled: connecting again with the same parameters reuses the already open bucket.
+        Use [#Destroy Couchbase Pool | Destroy Couchbase Pool] to really close pooled connections.
+
         *Args:*\n
             _host_ - couchbase server host name;\n
             _port_ - couchbase server port number;\n
@@ -42,33 +109,82 @@ class CouchbaseLibrary(object):
             _password_ - password;\n
             _alias_ - connection alias;\n
             _ipv6_ - parameter to allow ipv6 connection. Possible values: "disabled", "allow", "only";\n
+            _options_ - dictionary with additional connection string options of the Couchbase client,
+            e.g. operation_timeout (seconds), config_cache (file path), tcp_nodelay (boolean);\n
 
         *Returns:*\n
             The index of the first connection after initialization.
 
         *Example:*\n
         | Connect To Couchbase Bucket | my_host_name | 8091 | bucket_name | password | alias=bucket |
+        | &{options}= | Create Dictionary | operation_timeout=5 | tcp_nodelay=${True} |
+        | Connect To Couchbase Bucket | my_host_name | 8091 | bucket_name | password | options=${options} |
         """
-        logger.debug(f'Connecting using : host={host}, port={port}, bucketName={bucket_name}, password={password}')
-        connection_string = f'{host}:{port}/{bucket_name}?ipv6={ipv6}'
-        try:
-            bucket = Bucket(connection_string, password=password)
-            self._bucket = bucket
-            return self._cache.register(self._bucket, alias)
-        except CouchbaseError as info:
-            raise Exception(f"Could not connect to Couchbase bucket. Error: {info}")
+        if ipv6 not in _IPV6_MODES:
+            raise Exception(f'Invalid ipv6 value "{ipv6}". Possible values: "disabled", "allow", "only".')
+        if _debug_enabled():
+            logger.debug(f'Connecting using : host={host}, port={port}, bucketName={bucket_name}, password={password}')
+        connection_string = ''.join((host, ':', str(port), '/', bucket_name, '?ipv6=', ipv6))
+        client_options = tuple(sorted((name, _option_value(value)) for name, value in (options or {}).items()))
+        if client_options:
+            connection_string = '&'.join((connection_string, urlencode(client_options)))
+        self._flush_pipeline()
+        pool_key = (host, str(port), bucket_name, password, ipv6, client_options)
+        bucket = self._bucket_pool.get(pool_key)
+        if bucket is None:
+            try:
+                bucket = Bucket(connection_string, password=password)
+            except CouchbaseError as info:
+                raise Exception(f"Could not connect to Couchbase bucket. Error: {info}")
+            self._bucket_pool[pool_key] = bucket
+        self._bucket = bucket
+        return self._cache.register(self._bucket, alias)
+
+    def connect_to_couchbase_bucket_for_bulk_operations(self, host: str, port: Union[str, int], bucket_name: str,
+                                                        password: str = None, alias: str = None,
+                                                        ipv6: str = "disabled", options: Dict[str, Any] = None) -> int:
+        """
+        Connect to a Couchbase bucket with settings for loading large amounts of data.
+
+        Works as [#Connect To Couchbase Bucket | Connect To Couchbase Bucket],
+        but the key-value operation timeout is raised to 10 seconds,
+        so large [#Upsert Documents | Upsert Documents] requests don't time out.
+
+        *Args:*\n
+            _host_ - couchbase server host name;\n
+            _port_ - couchbase server port number;\n
+            _bucket_name_ - couchbase bucket name;\n
+            _password_ - password;\n
+            _alias_ - connection alias;\n
+            _ipv6_ - parameter to allow ipv6 connection. Possible values: "disabled", "allow", "only";\n
+            _options_ - dictionary with additional connection string options of the Couchbase client,
+            overrides the defaults;\n
+
+        *Returns:*\n
+            The index of the first connection after initialization.
+
+        *Example:*\n
+        | Connect To Couchbase Bucket For Bulk Operations | my_host_name | 8091 | bucket_name | password | alias=seed |
+        | Upsert Documents | ${documents} |
+        """
+        return self.connect_to_couchbase_bucket(host, port, bucket_name, password, alias, ipv6,
+                                                dict(_BULK_OPTIONS, **(options or {})))
 
     def disconnect_from_couchbase_bucket(self) -> None:
         """
         Close the current connection with a Couchbase bucket.
 
+        The bucket itself stays open in the connection pool,
+        see [#Destroy Couchbase Pool | Destroy Couchbase Pool].
+        An open [#Begin Couchbase Pipeline | pipeline] is committed and ended.
+
         *Example:*\n
         | Connect To Couchbase Bucket | my_host_name | 8091 | bucket_name | password | alias=bucket |
         | Disconnect From Couchbase Bucket |
         """
-        if self._bucket:
-            self._bucket._close()
+        self._end_pipeline()
         self._cache.empty_cache()
+        self._bucket = None
 
     def close_all_couchbase_bucket_connections(self) -> None:
         """
@@ -81,11 +197,37 @@ class CouchbaseLibrary(object):
         After execution of this keyword, index returned by [#Connect To Couchbase Bucket | Connect To Couchbase Bucket]
         starts at 1.
 
+        The buckets themselves stay open in the connection pool,
+        see [#Destroy Couchbase Pool | Destroy Couchbase Pool].
+        An open [#Begin Couchbase Pipeline | pipeline] is committed and ended.
+
         *Example:*\n
         | Connect To Couchbase Bucket | my_host_name | 8091 | bucket_name | password | alias=bucket |
         | Close All Couchbase Bucket Connections |
         """
-        self._bucket = self._cache.close_all()
+        self._end_pipeline()
+        self._cache.empty_cache()
+        self._bucket = None
+
+    def destroy_couchbase_pool(self) -> None:
+        """
+        Close all pooled Couchbase buckets and all connections with them.
+
+        This keyword is intended for suite teardown.
+        An open [#Begin Couchbase Pipeline | pipeline] is committed and ended.
+
+        *Example:*\n
+        | Connect To Couchbase Bucket | my_host_name | 8091 | bucket_name | password | alias=bucket |
+        | Destroy Couchbase Pool |
+        """
+        self._end_pipeline()
+        self._cache.empty_cache()
+        self._bucket = None
+        self._result_cache.clear()
+        pool = self._bucket_pool
+        while pool:
+            _, bucket = pool.popitem()
+            bucket._close()
 
     def switch_couchbase_bucket_connections(self, index_or_alias: Union[int, str]) -> int:
         """
@@ -109,6 +251,7 @@ class CouchbaseLibrary(object):
         | View Document By Key | key=1C1#000 |
         | Close All Couchbase Bucket Connections |
         """
+        self._flush_pipeline()
         old_index = self._cache.current_index
         self._bucket = self._cache.switch(index_or_alias)
         return old_index
@@ -117,6 +260,7 @@ class CouchbaseLibrary(object):
         """
         Get information about the presence of a document in the Couchbase bucket by the given key.
         Depending on the value of the return code, the presence or absence of the document in the bucket is determined.
+        Only the document metadata is requested from the master node, the document body is not transferred.
 
         *Args:*\n
             _key_ - document key;\n
@@ -128,17 +272,15 @@ class CouchbaseLibrary(object):
         *Example:*\n
         | ${rc}= | View Document By Key | key=1C1#000 |
         """
-        if self._bucket is None:
-            raise Exception('There is no open connection to a Couchbase bucket.')
-
-        result = self._bucket.get(key, quiet=True).rc
+        self._check_bucket()
+        result = self._observe_multi([key])[key]
         return result
 
     def bucket_contains_document_by_key(self, key: str) -> bool:
         """
         Check if the Couchbase bucket contains the document by the given key.
         Also it's possible to specify a reference document for comparison.
-        The option `quite` is used to check the presence of the document in the bucket.
+        Only the document metadata is requested from the master node, the document body is not transferred.
 
         *Args:*\n
             _key_ - document key;\n
@@ -150,13 +292,8 @@ class CouchbaseLibrary(object):
         | ${contain}=   |   Bucket Contains Document By Key |   key=1C1#000 |
         | Should Be True    |   ${contain}  |
         """
-        if self._bucket is None:
-            raise Exception('There is no open connection to a Couchbase bucket.')
-
-        result = self._bucket.get(key, quiet=True)
-        logger.debug("{key} contains is {success} with code={code}".format(key=key, success=result.success,
-                                                                           code=result.rc))
-        return result.success is True
+        self._check_bucket()
+        return self.bucket_contains_documents_by_keys([key])[key]
 
     def get_document_cas_by_key(self, key: str) -> int:
         """
@@ -171,10 +308,8 @@ class CouchbaseLibrary(object):
         *Example:*\n
         | ${cas}= | Get Document Cas By Key | key=1C1#000 |
         """
-        if self._bucket is None:
-            raise Exception('There is no open connection to a Couchbase bucket.')
-
-        result = self._bucket.get(key).cas
+        self._check_bucket()
+        result = self._get_multi([key])[key].cas
         return result
 
     def get_document_value_by_key(self, key: str) -> Any:
@@ -190,9 +325,8 @@ class CouchbaseLibrary(object):
         *Example:*\n
         | ${value}= | Get Document Value By Key | key=1C1#000 |
         """
-        if self._bucket is None:
-            raise Exception('There is no open connection to a Couchbase bucket.')
-        result = self._bucket.get(key).value
+        self._check_bucket()
+        result = self._get_multi([key])[key].value
         return result
 
     def validate_document_by_json(self, key: str, json_expr: str) -> bool:
@@ -211,15 +345,20 @@ class CouchbaseLibrary(object):
         | ${valid}= |   Validate Document By Json   |   key=dockey  |   json_expr=.somekey:val("value") |
         | Should Be True    |   ${valid}  |
         """
-        if self._bucket is None:
-            raise Exception('There is no open connection to a Couchbase bucket.')
-        result = self._bucket.get(key, quiet=True)
-        if result.success is not True:
+        self._check_bucket()
+        result = self._get_multi([key], quiet=True)[key]
+        if not result.success:
             return False
+        validator = self._json_validator
+        if validator is None:
+            from JsonValidator import JsonValidator, JsonValidatorError
+            self._json_validator_error = JsonValidatorError
+            validator = self._json_validator = JsonValidator()
         try:
-            JsonValidator().element_should_exist(result.value, json_expr)
-        except JsonValidatorError as error:
-            logger.debug("on json validation got exception {ex}".format(ex=error))
+            validator.element_should_exist(result.value, json_expr)
+        except self._json_validator_error as error:
+            if _debug_enabled():
+                logger.debug("on json validation got exception {ex}".format(ex=error))
             return False
         return True
 
@@ -234,9 +373,8 @@ class CouchbaseLibrary(object):
         *Example:*\n
         | Certainly Delete Document By Key | key=1C1#000 |
         """
-        if self._bucket is None:
-            raise Exception('There is no open connection to a Couchbase bucket.')
-        self._bucket.remove(key, quiet=True)
+        self._check_bucket()
+        self.certainly_delete_documents_by_keys([key])
 
     def upsert_document(self, key: str, value: Any) -> None:
         """
@@ -249,6 +387,381 @@ class CouchbaseLibrary(object):
         *Example:*\n
         |   Upsert Document |   somekey |   {'key': 'value'}    |
         """
+        self._check_bucket()
+        self.upsert_documents({key: value})
+
+    def get_documents_by_keys(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Get values of several documents in the Couchbase bucket by the given keys in one request.
+        For absent documents the value is None.
+
+        *Args:*\n
+            _keys_ - list of document keys;\n
+
+        *Returns:*\n
+            Dictionary with document keys and their values.\n
+
+        *Example:*\n
+        | ${values}= | Get Documents By Keys | ${keys} |
+        | ${value}= | Get From Dictionary | ${values} | 1C1#000 |
+        """
+        self._check_bucket()
+        results = self._get_multi(keys, quiet=True)
+        return {key: result.value for key, result in results.items()}
+
+    def bucket_contains_documents_by_keys(self, keys: Iterable[str]) -> Dict[str, bool]:
+        """
+        Check if the Couchbase bucket contains the documents by the given keys in one request.
+
+        *Args:*\n
+            _keys_ - list of document keys;\n
+
+        *Returns:*\n
+            Dictionary with document keys and True for those present in the bucket, False otherwise.
+
+        *Example:*\n
+        | ${contain}= | Bucket Contains Documents By Keys | ${keys} |
+        | Should Be True | ${contain['1C1#000']} |
+        """
+        self._check_bucket()
+        contains = {}
+        debug = _debug_enabled()
+        for key, code in self._observe_multi(keys).items():
+            found = code == 0
+            if debug:
+                logger.debug("{key} contains is {success} with code={code}".format(key=key, success=found, code=code))
+            contains[key] = found
+        return contains
+
+    def certainly_delete_documents_by_keys(self, keys: Iterable[str], chunk_size: Union[int, str] = None) -> None:
+        """
+        Remove several documents for the given keys from Couchbase bucket in one request.
+        Doesn't raise NotFoundError if some of the keys don't exist.
+
+        *Args:*\n
+            _keys_ - list of document keys;\n
+            _chunk_size_ - maximum number of documents removed in one request, all at once by default;\n
+
+        *Example:*\n
+        | Certainly Delete Documents By Keys | ${keys} |
+        | Certainly Delete Documents By Keys | ${keys} | chunk_size=1000 |
+        """
+        self._check_bucket()
+        if self._pending is not None:
+            enqueue = self._enqueue
+            for key in keys:
+                enqueue('remove', key)
+            return
+        keys = list(keys)
+        self._forget(keys)
+        remove_multi = self._bucket.remove_multi
+        for chunk in _chunks(keys, chunk_size):
+            if chunk:
+                remove_multi(chunk, quiet=True)
+
+    def upsert_documents(self, documents: Dict[str, Any],
+                         chunk_size: Union[int, str] = None) -> Optional[Dict[str, int]]:
+        """
+        Insert or update several documents in the current Couchbase bucket in one request.
+        Intended for loading test data instead of repeated [#Upsert Document | Upsert Document] calls.
+
+        *Args:*\n
+            _documents_ - dictionary with document keys and document bodies, e.g. created with `&{dict}` syntax;\n
+            _chunk_size_ - maximum number of documents sent in one request, all at once by default;\n
+
+        *Returns:*\n
+            Dictionary with document keys and CAS values of the written documents.\n
+            None inside [#Begin Couchbase Pipeline | pipeline], as the documents are only queued.
+
+        *Example:*\n
+        | &{documents}= | Create Dictionary | key1=${value1} | key2=${value2} |
+        | ${cas}= | Upsert Documents | ${documents} |
+        | Upsert Documents | ${documents} | chunk_size=1000 |
+        """
+        self._check_bucket()
+        if self._pending is not None:
+            enqueue = self._enqueue
+            for key, value in documents.items():
+                enqueue('upsert', key, value)
+            return None
+        self._forget(documents)
+        upsert_multi = self._bucket.upsert_multi
+        cas = {}
+        for chunk in _chunks(list(documents.items()), chunk_size):
+            if chunk:
+                results = upsert_multi(dict(chunk))
+                cas.update((key, result.cas) for key, result in results.items())
+        return cas
+
+    def begin_couchbase_pipeline(self) -> None:
+        """
+        Start collecting write operations on the current Couchbase bucket into a pipeline.
+
+        Inside the pipeline [#Upsert Document | Upsert Document], [#Upsert Documents | Upsert Documents],
+        [#Certainly Delete Document By Key | Certainly Delete Document By Key] and
+        [#Certainly Delete Documents By Keys | Certainly Delete Documents By Keys] are only queued.
+        Queued operations are sent in bulk by [#Commit Couchbase Pipeline | Commit Couchbase Pipeline],
+        on switching the bucket connection or before reading a document with a queued operation.
+        Documents read inside the pipeline are remembered, so repeated reads of the same key
+        don't go to the server.
+
+        *Example:*\n
+        | Begin Couchbase Pipeline |
+        | Upsert Document | key1 | ${value1} |
+        | Upsert Document | key2 | ${value2} |
+        | Certainly Delete Document By Key | key3 |
+        | Commit Couchbase Pipeline |
+        """
+        self._check_bucket()
+        if self._pending is not None:
+            raise Exception('Couchbase pipeline is already started.')
+        self._pending = {}
+
+    def commit_couchbase_pipeline(self) -> None:
+        """
+        Send all operations queued since [#Begin Couchbase Pipeline | Begin Couchbase Pipeline]
+        to the current Couchbase bucket and close the pipeline.
+        The pipeline is closed even if sending fails.
+
+        *Example:*\n
+        | Begin Couchbase Pipeline |
+        | Upsert Document | somekey | {'key': 'value'} |
+        | Commit Couchbase Pipeline |
+        """
+        if self._pending is None:
+            raise Exception('Couchbase pipeline is not started.')
+        self._end_pipeline()
+
+    def clear_couchbase_cache(self) -> None:
+        """
+        Forget all documents remembered by the library.
+
+        Documents are remembered if the library is imported with `cache_results=True`
+        and inside [#Begin Couchbase Pipeline | pipeline].
+        Changes made to the bucket not by this library are not seen until the cache is cleared.
+
+        *Example:*\n
+        | Clear Couchbase Cache |
+        """
+        self._result_cache.clear()
+
+    def gather_couchbase_operations(self, operations: Iterable[Iterable[Any]]) -> Dict[str, Any]:
+        """
+        Execute several operations on the current Couchbase bucket with one request per operation type.
+
+        Supported operations:
+        | upsert | key | value |
+        | remove | key |
+        | get    | key |
+        Write operations are applied first, so "get" returns the documents after all writes are done.
+        Inside [#Begin Couchbase Pipeline | pipeline] write operations are queued as usual.
+
+        *Args:*\n
+            _operations_ - list of operations, each one is a list with operation name, document key
+            and, for "upsert", document body;\n
+
+        *Returns:*\n
+            Dictionary with keys of "get" operations and document values, None for absent documents.\n
+
+        *Example:*\n
+        | @{upsert}= | Create List | upsert | key1 | ${value1} |
+        | @{remove}= | Create List | remove | key2 |
+        | @{get}= | Create List | get | key3 |
+        | @{operations}= | Create List | ${upsert} | ${remove} | ${get} |
+        | ${values}= | Gather Couchbase Operations | ${operations} |
+        """
+        self._check_bucket()
+        writes = []
+        reads = []
+        for operation in operations:
+            try:
+                name, key, *args = operation
+            except (TypeError, ValueError):
+                raise Exception(f'Unsupported Couchbase operation: {operation}')
+            if name == 'upsert' and len(args) == 1:
+                writes.append((name, key, args[0]))
+            elif name == 'remove' and not args:
+                writes.append((name, key, None))
+            elif name == 'get' and not args:
+                reads.append(key)
+            else:
+                raise Exception(f'Unsupported Couchbase operation: {operation}')
+
+        started = self._pending is None
+        if started:
+            self._pending = {}
+        try:
+            enqueue = self._enqueue
+            for name, key, value in writes:
+                enqueue(name, key, value)
+            if started:
+                self._flush_pipeline()
+        finally:
+            if started:
+                self._pending = None
+        results = self._get_multi(reads, quiet=True) if reads else {}
+        return {key: result.value for key, result in results.items()}
+
+    def _enqueue(self, operation: str, key: str, value: Any = None) -> None:
+        """
+        Queue an operation on the document into the pipeline.
+        Only the last operation for the key is kept, as it defines the final state of the document.
+
+        *Args:*\n
+            _operation_ - operation name: "upsert" or "remove";\n
+            _key_ - document key;\n
+            _value_ - document body for "upsert";\n
+        """
+        self._forget((key,))
+        self._pending[key] = (operation, value)
+
+    def _flush_pipeline(self) -> None:
+        """
+        Send queued operations to the current bucket using one request per operation type.
+        The queue is emptied only after all requests succeed.
+        """
+        pending = self._pending
+        if not pending:
+            return
+        upserts = {key: value for key, (operation, value) in pending.items() if operation == 'upsert'}
+        removes = [key for key, (operation, _) in pending.items() if operation == 'remove']
+        bucket = self._bucket
+        if upserts:
+            bucket.upsert_multi(upserts)
+        if removes:
+            bucket.remove_multi(removes, quiet=True)
+        self._pending = {}
+
+    def _end_pipeline(self) -> None:
+        """
+        Send queued operations to the current bucket and close the pipeline, if it is open.
+        The pipeline is closed even if sending fails.
+        """
+        if self._pending is None:
+            return
+        try:
+            self._flush_pipeline()
+        finally:
+            self._pending = None
+            if not self._cache_results:
+                self._result_cache.clear()
+
+    def _get_multi(self, keys: Iterable[str], quiet: bool = None) -> Dict[str, Union[ValueResult, _CachedResult]]:
+        """
+        Get several documents from the current Couchbase bucket in one request.
+        Remembered documents are taken from the result cache as copies,
+        so changes made by the caller don't affect the cache.
+
+        *Args:*\n
+            _keys_ - document keys;\n
+            _quiet_ - don't raise NotFoundError for absent documents;\n
+
+        *Returns:*\n
+            Dictionary with document keys and results of the get operation.
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+        if not self._cache_results and self._pending is None:
+            return self._bucket.get_multi(keys, quiet=quiet)
+
+        cached, missing = self._lookup_cache(keys)
+        results = {key: result._replace(value=deepcopy(result.value)) for key, result in cached.items()}
+        if missing:
+            fetched = self._bucket.get_multi(missing, quiet=quiet)
+            self._remember(fetched)
+            results.update(fetched)
+        return {key: results[key] for key in keys}
+
+    def _check_bucket(self) -> None:
+        """
+        Raise an exception if there is no open connection to a Couchbase bucket.
+        """
         if self._bucket is None:
             raise Exception('There is no open connection to a Couchbase bucket.')
-        self._bucket.upsert(key, value)
+
+    def _observe_multi(self, keys: Iterable[str]) -> Dict[str, int]:
+        """
+        Get information about the presence of several documents in the current Couchbase bucket in one request.
+        Only the master node is asked and the document bodies are not transferred.
+
+        *Args:*\n
+            _keys_ - document keys;\n
+
+        *Returns:*\n
+            Dictionary with document keys and return codes in terms of the get operation:
+            0 if the document is present, code of NotFoundError if it is absent.
+        """
+        keys = list(keys)
+        cached, missing = self._lookup_cache(keys)
+        observed = self._bucket.observe_multi(missing, master_only=True) if missing else {}
+        codes = {}
+        for key in keys:
+            if key in cached:
+                codes[key] = 0
+                continue
+            result = observed[key]
+            if not result.success:
+                codes[key] = result.rc
+            elif any(info.flags in _OBSERVE_FOUND_FLAGS for info in result.value):
+                codes[key] = 0
+            else:
+                codes[key] = NotFoundError.CODE
+        return codes
+
+    def _lookup_cache(self, keys: List[str]) -> Tuple[Dict[str, _CachedResult], List[str]]:
+        """
+        Find documents of the current bucket in the result cache.
+        Queued pipeline operations on these keys are sent to the bucket first.
+
+        *Args:*\n
+            _keys_ - document keys;\n
+
+        *Returns:*\n
+            Dictionary with the found results and list of keys absent in the cache.
+        """
+        if not self._cache_results and self._pending is None:
+            return {}, keys
+        if self._pending and any(key in self._pending for key in keys):
+            self._flush_pipeline()
+        bucket_id = id(self._bucket)
+        cache = self._result_cache
+        found = {}
+        missing = []
+        for key in keys:
+            cache_key = (bucket_id, key)
+            if cache_key in cache:
+                cache.move_to_end(cache_key)
+                found[key] = cache[cache_key]
+            else:
+                missing.append(key)
+        return found, missing
+
+    def _remember(self, results: Dict[str, ValueResult]) -> None:
+        """
+        Put copies of successful get results of the current bucket into the result cache,
+        dropping the least recently used entries above the cache size.
+
+        *Args:*\n
+            _results_ - dictionary with document keys and results of the get operation;\n
+        """
+        bucket_id = id(self._bucket)
+        cache = self._result_cache
+        for key, result in results.items():
+            if result.success:
+                cache[(bucket_id, key)] = _CachedResult(deepcopy(result.value), result.cas, result.rc, result.success)
+        while len(cache) > self._cache_size:
+            cache.popitem(last=False)
+
+    def _forget(self, keys: Iterable[str]) -> None:
+        """
+        Remove documents of the current bucket from the result cache.
+
+        *Args:*\n
+            _keys_ - document keys;\n
+        """
+        if not self._result_cache:
+            return
+        bucket_id = id(self._bucket)
+        for key in keys:
+            self._result_cache.pop((bucket_id, key), None)